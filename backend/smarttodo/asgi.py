@@ -7,10 +7,57 @@ For more information on this file, see
 https://docs.djangoproject.com/en/5.2/howto/deployment/asgi/
 """
 
+import logging
 import os
 
+from asgiref.sync import sync_to_async
+from django.conf import settings
 from django.core.asgi import get_asgi_application
 
 os.environ.setdefault('DJANGO_SETTINGS_MODULE', 'smarttodo.settings')
 
-application = get_asgi_application()
+django_application = get_asgi_application()
+
+logger = logging.getLogger(__name__)
+
+# Whether the server sent lifespan.startup; warn once if reminders are on but it never did
+lifespan_started = False
+warned_no_lifespan = False
+
+
+async def application(scope, receive, send):
+    global lifespan_started, warned_no_lifespan
+
+    # Django only speaks HTTP, so handle the lifespan protocol here to run
+    # the due-date reminder scheduler alongside the server
+    if scope['type'] != 'lifespan':
+        if settings.TASK_REMINDERS_ENABLED and not lifespan_started and not warned_no_lifespan:
+            warned_no_lifespan = True
+            logger.warning(
+                "TASK_REMINDERS_ENABLED is set but the server never sent lifespan "
+                "startup, so the reminder scheduler is not running"
+            )
+        return await django_application(scope, receive, send)
+
+    from tasks.reminders import scheduler
+
+    while True:
+        message = await receive()
+        if message['type'] == 'lifespan.startup':
+            lifespan_started = True
+            if settings.TASK_REMINDERS_ENABLED and not await sync_to_async(scheduler.start)():
+                # Other workers' Task signals would never reach the scheduler's
+                # heap, so refuse to boot rather than silently miss reminders
+                await send({
+                    'type': 'lifespan.startup.failed',
+                    'message': (
+                        "Reminder scheduler is already running in another worker; "
+                        "TASK_REMINDERS_ENABLED requires a single worker process"
+                    ),
+                })
+                return
+            await send({'type': 'lifespan.startup.complete'})
+        elif message['type'] == 'lifespan.shutdown':
+            await sync_to_async(scheduler.stop)()
+            await send({'type': 'lifespan.shutdown.complete'})
+            return
@@ -4,6 +4,7 @@ Works in both local dev and production (Render).
 """
 
 import os
+import tempfile
 from pathlib import Path
 from decouple import config
 import dj_database_url
@@ -148,6 +149,25 @@ else:
         default="https://your-frontend.vercel.app",
     ).split(",")  # comma separated list
 
+# -------------------------
+# Task reminders
+# -------------------------
+# Run the in-process due-date scheduler from the ASGI lifespan. The default
+# Procfile serves WSGI; the host that runs reminders must serve ASGI instead
+# (e.g. `uvicorn smarttodo.asgi:application`, uvicorn installed separately).
+# Enable this on a single host only.
+TASK_REMINDERS_ENABLED = config("TASK_REMINDERS_ENABLED", default=False, cast=bool)
+TASK_REMINDERS_LOCK_FILE = config(
+    "TASK_REMINDERS_LOCK_FILE",
+    default=os.path.join(tempfile.gettempdir(), "smarttodo-reminders.lock"),
+)
+
+# -------------------------
+# Task archive
+# -------------------------
+# Completed tasks older than this are moved out by `manage.py archive_tasks`
+TASK_ARCHIVE_AFTER_DAYS = config("TASK_ARCHIVE_AFTER_DAYS", default=90, cast=int)
+
 # -------------------------
 # Default PK
 # -------------------------
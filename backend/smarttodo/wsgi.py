@@ -7,10 +7,19 @@ For more information on this file, see
 https://docs.djangoproject.com/en/5.2/howto/deployment/wsgi/
 """
 
+import logging
 import os
 
+from django.conf import settings
 from django.core.wsgi import get_wsgi_application
 
 os.environ.setdefault('DJANGO_SETTINGS_MODULE', 'smarttodo.settings')
 
 application = get_wsgi_application()
+
+if settings.TASK_REMINDERS_ENABLED:
+    # The reminder scheduler is started from the ASGI lifespan only
+    logging.getLogger(__name__).warning(
+        "TASK_REMINDERS_ENABLED is set but WSGI has no lifespan; serve "
+        "smarttodo.asgi:application to run the reminder scheduler"
+    )
@@ -0,0 +1,67 @@
+import logging
+from datetime import timedelta
+
+from django.db import transaction
+from django.db.models import Q, Value
+from django.utils import timezone
+
+from .models import ArchivedTask, Task
+
+# Configure logging
+logger = logging.getLogger(__name__)
+
+ARCHIVE_FIELDS = [
+    'id', 'title', 'description', 'due_date', 'priority', 'category',
+    'completed', 'created_at', 'updated_at', 'completed_at',
+]
+
+
+def archivable_tasks(older_than_days):
+    """Completed tasks that have been done for longer than the given age"""
+    cutoff = timezone.now() - timedelta(days=older_than_days)
+    return Task.objects.filter(completed=True).filter(
+        Q(completed_at__lt=cutoff) |
+        # Rows written without save() (e.g. bulk imports) have no completed_at
+        Q(completed_at__isnull=True, updated_at__lt=cutoff)
+    )
+
+
+def archive_completed_tasks(older_than_days, batch_size=1000):
+    """
+    Move old completed tasks into the archive table, one transaction per batch
+    """
+    archived = 0
+    while True:
+        with transaction.atomic():
+            # Lock the batch so a task can't be reopened between copy and delete
+            rows = list(
+                archivable_tasks(older_than_days)
+                .select_for_update(skip_locked=True)
+                .order_by('id')
+                .values(*ARCHIVE_FIELDS)[:batch_size]
+            )
+            if not rows:
+                break
+
+            ArchivedTask.objects.bulk_create([ArchivedTask(**row) for row in rows])
+            # Plain DELETE: .delete() would reload every row to send post_delete,
+            # and completed tasks never have a pending reminder anyway
+            batch = Task.objects.filter(id__in=[row['id'] for row in rows])
+            batch._raw_delete(batch.db)
+
+        archived += len(rows)
+        logger.info(f"Archived {archived} tasks so far")
+
+    return archived
+
+
+def with_archived(queryset, archived_queryset):
+    """
+    Union a Task queryset with the matching archived tasks.
+
+    Both sides are reduced to plain values so the result can be serialized
+    with TaskSerializer; archived tasks are completed, so never overdue.
+    """
+    live = queryset.order_by().values(*ARCHIVE_FIELDS).annotate(is_overdue=Value(False))
+    archived = archived_queryset.order_by().values(*ARCHIVE_FIELDS).annotate(is_overdue=Value(False))
+    return live.union(archived, all=True).order_by(*Task._meta.ordering)
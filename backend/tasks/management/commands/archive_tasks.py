@@ -0,0 +1,22 @@
+from django.conf import settings
+from django.core.management.base import BaseCommand
+
+from tasks.archive import archive_completed_tasks
+
+
+class Command(BaseCommand):
+    help = 'Move old completed tasks out of the main tasks table'
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--older-than-days', type=int, default=settings.TASK_ARCHIVE_AFTER_DAYS,
+            help='Archive tasks completed more than this many days ago',
+        )
+        parser.add_argument('--batch-size', type=int, default=1000)
+
+    def handle(self, *args, **options):
+        archived = archive_completed_tasks(
+            options['older_than_days'],
+            batch_size=options['batch_size'],
+        )
+        self.stdout.write(self.style.SUCCESS(f'Archived {archived} tasks'))
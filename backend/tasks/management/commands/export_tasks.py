@@ -0,0 +1,66 @@
+import csv
+import itertools
+import json
+import sys
+
+from django.core.management.base import BaseCommand
+
+from tasks.models import ArchivedTask, Task
+
+EXPORT_FIELDS = [
+    'id', 'title', 'description', 'due_date', 'priority', 'category',
+    'completed', 'created_at', 'updated_at', 'completed_at',
+]
+
+
+class Command(BaseCommand):
+    help = (
+        'Stream tasks to a CSV or NDJSON file. Archived tasks are only '
+        'included with --include-archived'
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument('path', nargs='?', default='-', help="Output file, or '-' for stdout")
+        parser.add_argument('--format', choices=['csv', 'ndjson'], default='ndjson')
+        parser.add_argument('--chunk-size', type=int, default=5000)
+        parser.add_argument(
+            '--include-archived', action='store_true',
+            help='Also export tasks moved out by archive_tasks',
+        )
+
+    def handle(self, *args, **options):
+        path = options['path']
+        fmt = options['format']
+
+        models = [Task, ArchivedTask] if options['include_archived'] else [Task]
+        # iterator() uses a server-side cursor on Postgres, so memory stays flat
+        rows = itertools.chain.from_iterable(
+            model.objects
+            .order_by('id')
+            .values_list(*EXPORT_FIELDS)
+            .iterator(chunk_size=options['chunk_size'])
+            for model in models
+        )
+
+        stream = sys.stdout if path == '-' else open(path, 'w', newline='', encoding='utf-8')
+        count = 0
+        try:
+            if fmt == 'csv':
+                writer = csv.writer(stream)
+                writer.writerow(EXPORT_FIELDS)
+                for row in rows:
+                    writer.writerow(self._serialize(row))
+                    count += 1
+            else:
+                for row in rows:
+                    stream.write(json.dumps(dict(zip(EXPORT_FIELDS, self._serialize(row)))))
+                    stream.write('\n')
+                    count += 1
+        finally:
+            if stream is not sys.stdout:
+                stream.close()
+
+        self.stderr.write(self.style.SUCCESS(f'Exported {count} tasks'))
+
+    def _serialize(self, row):
+        return [value.isoformat() if hasattr(value, 'isoformat') else value for value in row]
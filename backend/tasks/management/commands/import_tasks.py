@@ -0,0 +1,208 @@
+import csv
+import io
+import json
+import os
+import sys
+import time
+
+from django.core.management.base import BaseCommand, CommandError
+from django.db import connection, transaction
+from django.utils import timezone
+from rest_framework.exceptions import ValidationError
+
+from tasks.models import ImportCheckpoint, Task
+from tasks.serializers import TaskImportSerializer
+
+COPY_COLUMNS = [
+    'title', 'description', 'due_date', 'priority', 'category',
+    'completed', 'created_at', 'updated_at', 'completed_at',
+]
+
+
+class Command(BaseCommand):
+    help = 'Stream tasks from a CSV or NDJSON file into the database'
+
+    def add_arguments(self, parser):
+        parser.add_argument('path', help="Input file, or '-' for stdin")
+        parser.add_argument(
+            '--format', choices=['csv', 'ndjson'],
+            help='Input format (defaults to the file extension)',
+        )
+        parser.add_argument(
+            '--parse', action='store_true',
+            help="Run each record's 'text' field through the NLP parser; "
+                 'explicit columns override parsed values',
+        )
+        parser.add_argument('--chunk-size', type=int, default=5000)
+        parser.add_argument(
+            '--checkpoint',
+            help='Name of a checkpoint stored in the database, updated in the '
+                 'same transaction as each chunk; an existing one is resumed from',
+        )
+        parser.add_argument(
+            '--no-copy', action='store_true',
+            help='Use bulk_create even when Postgres COPY is available',
+        )
+
+    def handle(self, *args, **options):
+        path = options['path']
+        fmt = options['format'] or self._guess_format(path)
+        chunk_size = options['chunk_size']
+        checkpoint = options['checkpoint']
+        use_copy = not options['no_copy'] and self._copy_available()
+
+        parser = None
+        if options['parse']:
+            from tasks.nlp_parser import TaskParser
+            parser = TaskParser()
+
+        skip = self._read_checkpoint(checkpoint)
+        if skip:
+            self.stderr.write(f'Resuming after {skip} records')
+
+        stream = sys.stdin if path == '-' else open(path, newline='', encoding='utf-8')
+        try:
+            records = self._read_records(stream, fmt)
+            position = 0
+            imported = 0
+            failed = 0
+            started = time.monotonic()
+            chunk = []
+
+            for record in records:
+                position += 1
+                if position <= skip:
+                    continue
+
+                data = self._prepare(record, parser, position)
+                if data is None:
+                    failed += 1
+                else:
+                    chunk.append((position, data))
+
+                if position % chunk_size == 0:
+                    tasks = self._validate_chunk(chunk)
+                    failed += len(chunk) - len(tasks)
+                    imported += self._write_chunk(tasks, use_copy, checkpoint, position)
+                    chunk = []
+                    self._report(position, imported, failed, started)
+
+            if position > skip:
+                tasks = self._validate_chunk(chunk)
+                failed += len(chunk) - len(tasks)
+                imported += self._write_chunk(tasks, use_copy, checkpoint, position)
+        finally:
+            if stream is not sys.stdin:
+                stream.close()
+
+        self.stdout.write(self.style.SUCCESS(
+            f'Imported {imported} tasks ({failed} rejected) in {time.monotonic() - started:.1f}s'
+        ))
+
+    def _guess_format(self, path):
+        ext = os.path.splitext(path)[1].lower()
+        if ext == '.csv':
+            return 'csv'
+        if ext in ('.ndjson', '.jsonl'):
+            return 'ndjson'
+        raise CommandError('Cannot infer input format, pass --format')
+
+    def _read_records(self, stream, fmt):
+        if fmt == 'csv':
+            for row in csv.DictReader(stream):
+                # Empty CSV cells mean "use the default", not an empty value
+                yield {key: value for key, value in row.items() if value not in ('', None)}
+        else:
+            for line in stream:
+                line = line.strip()
+                if not line:
+                    continue
+                # Bad lines are passed on so they are rejected, not fatal
+                try:
+                    yield json.loads(line)
+                except json.JSONDecodeError as e:
+                    yield e
+
+    def _prepare(self, record, parser, position):
+        """Turn a raw record into serializer input, or None if it is unusable"""
+        if isinstance(record, json.JSONDecodeError):
+            self._reject(position, f'invalid JSON: {record}')
+            return None
+        if not isinstance(record, dict):
+            self._reject(position, 'expected a JSON object')
+            return None
+
+        text = record.pop('text', None)
+        if parser is not None and text:
+            data, _ = parser.parse_with_overrides(text, record)
+        else:
+            data = record
+            data.setdefault('title', text)
+        return data
+
+    def _validate_chunk(self, chunk):
+        # One serializer per chunk, so its fields are built once rather than per row
+        serializer = TaskImportSerializer()
+        tasks = []
+        for position, data in chunk:
+            try:
+                tasks.append(Task(**serializer.run_validation(data)))
+            except ValidationError as e:
+                self._reject(position, json.dumps(e.detail))
+        return tasks
+
+    def _reject(self, position, reason):
+        self.stderr.write(f'Record {position} rejected: {reason}')
+
+    def _copy_available(self):
+        if connection.vendor != 'postgresql':
+            return False
+        with connection.cursor() as cursor:
+            return hasattr(cursor.cursor, 'copy_expert')
+
+    def _write_chunk(self, tasks, use_copy, checkpoint, position):
+        # The checkpoint moves in the same transaction as the rows, so a crash
+        # can never leave a committed chunk that a resume would import again
+        with transaction.atomic():
+            if tasks and use_copy:
+                self._copy_chunk(tasks)
+            elif tasks:
+                Task.objects.bulk_create(tasks)
+            if checkpoint:
+                ImportCheckpoint.objects.update_or_create(
+                    name=checkpoint, defaults={'position': position}
+                )
+        return len(tasks)
+
+    def _copy_chunk(self, tasks):
+        # COPY skips the ORM, so fill in what auto_now/auto_now_add would
+        now = timezone.now()
+        buffer = io.StringIO()
+        writer = csv.writer(buffer)
+        for task in tasks:
+            task.created_at = task.updated_at = now
+            writer.writerow([
+                r'\N' if value is None else value
+                for value in (getattr(task, column) for column in COPY_COLUMNS)
+            ])
+        buffer.seek(0)
+
+        with connection.cursor() as cursor:
+            cursor.cursor.copy_expert(
+                f'COPY {Task._meta.db_table} ({", ".join(COPY_COLUMNS)}) '
+                r"FROM STDIN WITH (FORMAT csv, NULL '\N')",
+                buffer,
+            )
+
+    def _read_checkpoint(self, checkpoint):
+        if not checkpoint:
+            return 0
+        saved = ImportCheckpoint.objects.filter(name=checkpoint).first()
+        return saved.position if saved else 0
+
+    def _report(self, position, imported, failed, started):
+        elapsed = time.monotonic() - started
+        rate = imported / elapsed if elapsed else 0
+        self.stderr.write(
+            f'{position} records read, {imported} imported, {failed} rejected ({rate:.0f}/s)'
+        )
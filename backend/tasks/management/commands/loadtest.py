@@ -0,0 +1,266 @@
+import json
+import random
+import threading
+import time
+from collections import defaultdict
+from concurrent.futures import ThreadPoolExecutor
+from datetime import timedelta
+
+from django.conf import settings
+from django.core.management.base import BaseCommand, CommandError
+from django.db import connection
+from django.test import Client, override_settings
+from django.test.utils import CaptureQueriesContext
+from django.urls import reverse
+from django.utils import timezone
+
+from tasks.models import Task
+
+# Seeded and created tasks carry this prefix so --cleanup can find them
+TITLE_PREFIX = '[loadtest]'
+
+CATEGORY_WEIGHTS = {
+    'work': 30, 'personal': 25, 'shopping': 15, 'study': 12, 'health': 10, 'other': 8,
+}
+PRIORITY_WEIGHTS = {1: 20, 2: 45, 3: 25, 4: 10}
+
+DEFAULT_MIX = 'list=30,detail=20,update=5,toggle=10,stats=15,parse=10,create=10'
+
+SAMPLE_TEXTS = [
+    'urgent call client about the proposal tomorrow at 10am',
+    'buy groceries tonight',
+    'study for exam next week',
+    'gym workout this evening',
+    'maybe read a book sometime',
+    'important team meeting on friday at 3pm',
+    'pick up medicine in 2 hours',
+    'dentist checkup monday',
+]
+
+
+class Command(BaseCommand):
+    help = 'Seed synthetic tasks and replay a mixed API workload, reporting latency as JSON'
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--seed', type=int, default=10000,
+            help='Replace existing load-test tasks with this many new ones (0 to reuse them)',
+        )
+        parser.add_argument('--requests', type=int, default=2000, help='Total requests to replay')
+        parser.add_argument('--concurrency', type=int, default=4)
+        parser.add_argument(
+            '--mix', default=DEFAULT_MIX,
+            help=f'Comma separated endpoint=weight pairs (default: {DEFAULT_MIX})',
+        )
+        parser.add_argument('--random-seed', type=int, default=0)
+        parser.add_argument('--output', help='Write the JSON report here instead of stdout')
+        parser.add_argument(
+            '--cleanup', action='store_true',
+            help='Delete all load-test tasks after the run',
+        )
+
+    def handle(self, *args, **options):
+        rng = random.Random(options['random_seed'])
+        mix = self._parse_mix(options['mix'])
+
+        if options['seed']:
+            # Start from a fresh dataset so runs with the same --random-seed
+            # replay the same plan against the same tasks
+            deleted, _ = Task.objects.filter(title__startswith=TITLE_PREFIX).delete()
+            if deleted:
+                self.stderr.write(f'Deleted {deleted} load-test tasks from a previous run')
+
+            started = time.monotonic()
+            self._seed(options['seed'], rng)
+            self.stderr.write(f"Seeded {options['seed']} tasks in {time.monotonic() - started:.1f}s")
+
+        # Only load-test tasks are targeted, so writes never touch real data
+        task_ids = list(
+            Task.objects.filter(title__startswith=TITLE_PREFIX).values_list('id', flat=True)
+        )
+        if not task_ids and any(name in mix for name in ('detail', 'update', 'toggle')):
+            raise CommandError('No tasks to target, seed some with --seed')
+
+        endpoints = list(mix)
+        weights = [mix[name] for name in endpoints]
+        plan = [
+            (name, rng.choice(task_ids) if task_ids else None, rng.random())
+            for name in rng.choices(endpoints, weights=weights, k=options['requests'])
+        ]
+
+        # django.test.Client sends Host: testserver
+        with override_settings(ALLOWED_HOSTS=[*settings.ALLOWED_HOSTS, 'testserver']):
+            results, elapsed = self._replay(plan, options['concurrency'])
+
+        report = self._report(results, elapsed, options)
+
+        if options['cleanup']:
+            deleted, _ = Task.objects.filter(title__startswith=TITLE_PREFIX).delete()
+            self.stderr.write(f'Deleted {deleted} load-test tasks')
+
+        output = json.dumps(report, indent=2)
+        if options['output']:
+            with open(options['output'], 'w') as f:
+                f.write(output + '\n')
+        else:
+            self.stdout.write(output)
+
+    def _parse_mix(self, value):
+        mix = {}
+        for part in value.split(','):
+            name, _, weight = part.partition('=')
+            name = name.strip()
+            if not hasattr(self, f'_request_{name}'):
+                raise CommandError(f'Unknown endpoint in --mix: {name}')
+            try:
+                mix[name] = float(weight)
+            except ValueError:
+                raise CommandError(f'Invalid weight for {name}: {weight!r}')
+        return mix
+
+    def _seed(self, count, rng, batch_size=5000):
+        now = timezone.now()
+        categories = list(CATEGORY_WEIGHTS)
+        priorities = list(PRIORITY_WEIGHTS)
+
+        batch = []
+        for i in range(count):
+            completed = rng.random() < 0.35
+            due_date = None
+            if rng.random() < 0.7:
+                # Completed tasks skew into the past, pending ones around now
+                offset_days = rng.gauss(-10 if completed else 3, 15)
+                due_date = now + timedelta(days=offset_days)
+
+            batch.append(Task(
+                title=f'{TITLE_PREFIX} {rng.choice(SAMPLE_TEXTS)} #{i}',
+                due_date=due_date,
+                priority=rng.choices(priorities, weights=PRIORITY_WEIGHTS.values())[0],
+                category=rng.choices(categories, weights=CATEGORY_WEIGHTS.values())[0],
+                completed=completed,
+                completed_at=(due_date or now) if completed else None,
+            ))
+            if len(batch) >= batch_size:
+                Task.objects.bulk_create(batch)
+                batch = []
+
+        if batch:
+            Task.objects.bulk_create(batch)
+
+    def _replay(self, plan, concurrency):
+        results = []
+        lock = threading.Lock()
+        position = iter(range(len(plan)))
+
+        def worker():
+            client = Client(raise_request_exception=False)
+            local = []
+            try:
+                while True:
+                    with lock:
+                        index = next(position, None)
+                    if index is None:
+                        break
+
+                    name, task_id, roll = plan[index]
+                    with CaptureQueriesContext(connection) as queries:
+                        started = time.perf_counter()
+                        response = getattr(self, f'_request_{name}')(client, task_id, roll)
+                        latency = time.perf_counter() - started
+                    local.append((name, latency, response.status_code, len(queries)))
+            finally:
+                connection.close()
+
+            with lock:
+                results.extend(local)
+
+        started = time.perf_counter()
+        with ThreadPoolExecutor(max_workers=concurrency) as executor:
+            futures = [executor.submit(worker) for _ in range(concurrency)]
+            for future in futures:
+                future.result()
+        return results, time.perf_counter() - started
+
+    def _request_list(self, client, task_id, roll):
+        if roll < 0.5:
+            return client.get(reverse('task_list_create'), {'completed': 'false'})
+        if roll < 0.8:
+            return client.get(reverse('task_list_create'))
+        category = list(CATEGORY_WEIGHTS)[int(roll * 100) % len(CATEGORY_WEIGHTS)]
+        return client.get(reverse('task_list_create'), {'category': category})
+
+    def _request_detail(self, client, task_id, roll):
+        return client.get(reverse('task_detail', args=[task_id]))
+
+    def _request_update(self, client, task_id, roll):
+        return client.patch(
+            reverse('task_detail', args=[task_id]),
+            data=json.dumps({'priority': 1 + int(roll * 4)}),
+            content_type='application/json',
+        )
+
+    def _request_toggle(self, client, task_id, roll):
+        return client.patch(reverse('toggle_task', args=[task_id]))
+
+    def _request_stats(self, client, task_id, roll):
+        return client.get(reverse('task_stats'))
+
+    def _request_parse(self, client, task_id, roll):
+        text = SAMPLE_TEXTS[int(roll * len(SAMPLE_TEXTS))]
+        return client.post(
+            reverse('parse_natural_language'),
+            data=json.dumps({'text': text}),
+            content_type='application/json',
+        )
+
+    def _request_create(self, client, task_id, roll):
+        text = SAMPLE_TEXTS[int(roll * len(SAMPLE_TEXTS))]
+        return client.post(
+            reverse('task_list_create'),
+            data=json.dumps({
+                'title': f'{TITLE_PREFIX} {text}',
+                'category': list(CATEGORY_WEIGHTS)[int(roll * 100) % len(CATEGORY_WEIGHTS)],
+            }),
+            content_type='application/json',
+        )
+
+    def _report(self, results, elapsed, options):
+        by_endpoint = defaultdict(list)
+        for name, latency, status_code, query_count in results:
+            by_endpoint[name].append((latency, status_code, query_count))
+
+        endpoints = {}
+        for name, samples in sorted(by_endpoint.items()):
+            latencies = sorted(latency for latency, _, _ in samples)
+            endpoints[name] = {
+                'requests': len(samples),
+                'errors': sum(1 for _, status_code, _ in samples if status_code >= 400),
+                'throughput_rps': round(len(samples) / elapsed, 2),
+                'latency_ms': {
+                    'p50': _percentile_ms(latencies, 50),
+                    'p95': _percentile_ms(latencies, 95),
+                    'p99': _percentile_ms(latencies, 99),
+                    'max': round(latencies[-1] * 1000, 3),
+                },
+                'queries_per_request': round(
+                    sum(query_count for _, _, query_count in samples) / len(samples), 2
+                ),
+            }
+
+        return {
+            'database': connection.vendor,
+            'task_count': Task.objects.count(),
+            'requests': len(results),
+            'concurrency': options['concurrency'],
+            'mix': options['mix'],
+            'random_seed': options['random_seed'],
+            'elapsed_s': round(elapsed, 3),
+            'throughput_rps': round(len(results) / elapsed, 2) if elapsed else 0,
+            'endpoints': endpoints,
+        }
+
+
+def _percentile_ms(sorted_values, pct):
+    # Nearest-rank percentile
+    index = max(0, -(-len(sorted_values) * pct // 100) - 1)
+    return round(sorted_values[int(index)] * 1000, 3)
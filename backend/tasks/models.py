@@ -26,6 +26,7 @@ class Task(models.Model):
     completed = models.BooleanField(default=False)
     created_at = models.DateTimeField(auto_now_add=True)
     updated_at = models.DateTimeField(auto_now=True)
+    completed_at = models.DateTimeField(blank=True, null=True)
     
     class Meta:
         ordering = ['-priority', 'due_date', '-created_at']
@@ -39,8 +40,55 @@ class Task(models.Model):
     def __str__(self):
         return self.title
     
+    def save(self, *args, **kwargs):
+        # Track when a task was completed so old ones can be archived
+        if self.completed and self.completed_at is None:
+            self.completed_at = timezone.now()
+        elif not self.completed:
+            self.completed_at = None
+        super().save(*args, **kwargs)
+    
     @property
     def is_overdue(self):
         if self.due_date and not self.completed:
             return timezone.now() > self.due_date
-        return False
\ No newline at end of file
+        return False
+
+
+class ArchivedTask(models.Model):
+    """Completed tasks moved out of the main table by ``archive_tasks``"""
+    # Keeps the original Task id so archived tasks can still be referenced
+    id = models.BigIntegerField(primary_key=True)
+    title = models.CharField(max_length=255)
+    description = models.TextField(blank=True, null=True)
+    due_date = models.DateTimeField(blank=True, null=True)
+    priority = models.IntegerField(choices=Task.PRIORITY_CHOICES, default=2)
+    category = models.CharField(max_length=50, choices=Task.CATEGORY_CHOICES, default='other')
+    completed = models.BooleanField(default=True)
+    created_at = models.DateTimeField()
+    updated_at = models.DateTimeField()
+    completed_at = models.DateTimeField(blank=True, null=True)
+    archived_at = models.DateTimeField(auto_now_add=True)
+    
+    class Meta:
+        ordering = ['-priority', 'due_date', '-created_at']
+        indexes = [
+            models.Index(fields=['completed_at']),
+        ]
+    
+    def __str__(self):
+        return self.title
+    
+    @property
+    def is_overdue(self):
+        return False
+
+
+class ImportCheckpoint(models.Model):
+    """Records committed progress of a named ``import_tasks`` run"""
+    name = models.CharField(max_length=255, unique=True)
+    position = models.PositiveBigIntegerField(default=0)
+    updated_at = models.DateTimeField(auto_now=True)
+    
+    def __str__(self):
+        return f'{self.name} @ {self.position}'
@@ -126,6 +126,19 @@ class TaskParser:
             
         return result
 
+    def parse_with_overrides(self, text, overrides=None):
+        """Parse text into task fields, letting explicitly given values win"""
+        parsed = self.parse_task(text)
+        data = {
+            'title': parsed['title'],
+            'description': parsed['description'],
+            'due_date': parsed['due_date'],
+            'priority': parsed['priority'],
+            'category': parsed['category'],
+        }
+        data.update(overrides or {})
+        return data, parsed['confidence']
+
     def _extract_date_enhanced(self, text):
         """Enhanced date extraction with better accuracy"""
         text_lower = text.lower()
@@ -0,0 +1,205 @@
+import heapq
+import logging
+import threading
+
+try:
+    import fcntl
+except ImportError:  # Windows: no cross-process guard, fine for local dev
+    fcntl = None
+
+from django.conf import settings
+from django.db import close_old_connections
+from django.utils import timezone
+
+from .signals import task_due
+
+# Configure logging
+logger = logging.getLogger(__name__)
+
+
+class ReminderScheduler:
+    """
+    Fires ``task_due`` when a pending task's due date arrives.
+
+    Upcoming due dates are loaded into a min-heap once on start and kept in
+    sync from Task save/delete signals, so the worker thread only wakes up
+    for actual due events instead of polling the table. Changes made with
+    ``QuerySet.update()`` or ``bulk_create()`` bypass signals and are not
+    picked up until the next start.
+
+    Signals only reach the scheduler in the process that saved the task, so
+    the server must run a single worker: ``start()`` takes an exclusive lock
+    on ``TASK_REMINDERS_LOCK_FILE`` and returns False in any other worker,
+    which then fails its ASGI lifespan startup. Writes from other processes
+    (management commands, other hosts) are only picked up on the next start.
+    """
+
+    def __init__(self):
+        self._heap = []
+        self._pending = {}  # task id -> due timestamp currently scheduled
+        self._condition = threading.Condition()
+        self._thread = None
+        self._running = False
+        self._lock_file = None
+
+    @property
+    def running(self):
+        return self._running
+
+    def start(self):
+        """Start the worker thread; returns False if another process owns it"""
+        with self._condition:
+            if self._running:
+                return True
+            if not self._acquire_lock():
+                logger.error("Reminder scheduler already running in another process")
+                return False
+            self._running = True
+
+        self._load()
+        self._thread = threading.Thread(
+            target=self._run, name='task-reminders', daemon=True
+        )
+        self._thread.start()
+        logger.info(f"Reminder scheduler started with {len(self._pending)} pending tasks")
+        return True
+
+    def stop(self):
+        with self._condition:
+            self._running = False
+            self._heap.clear()
+            self._pending.clear()
+            self._condition.notify()
+
+        if self._thread is not None:
+            self._thread.join(timeout=5)
+            self._thread = None
+        self._release_lock()
+
+    def schedule(self, task_id, due_date):
+        """Schedule (or reschedule) a reminder for a task"""
+        if due_date is None:
+            self.unschedule(task_id)
+            return
+
+        due_ts = due_date.timestamp()
+        with self._condition:
+            if not self._running or self._pending.get(task_id) == due_ts:
+                return
+
+            self._pending[task_id] = due_ts
+            heapq.heappush(self._heap, (due_ts, task_id))
+            self._compact()
+
+            # Only wake the worker if this is now the earliest reminder
+            if self._heap[0] == (due_ts, task_id):
+                self._condition.notify()
+
+    def unschedule(self, task_id):
+        """Drop a task's reminder; its heap entry is discarded lazily"""
+        with self._condition:
+            self._pending.pop(task_id, None)
+
+    def sync(self, task):
+        """Bring the schedule in line with a saved task"""
+        if task.completed or task.due_date is None or task.due_date <= timezone.now():
+            self.unschedule(task.pk)
+        else:
+            self.schedule(task.pk, task.due_date)
+
+    def _acquire_lock(self):
+        if fcntl is None:
+            return True
+
+        lock_file = open(settings.TASK_REMINDERS_LOCK_FILE, 'a')
+        try:
+            fcntl.flock(lock_file, fcntl.LOCK_EX | fcntl.LOCK_NB)
+        except OSError:
+            lock_file.close()
+            return False
+
+        self._lock_file = lock_file
+        return True
+
+    def _release_lock(self):
+        # Closing the file drops the flock; it is also released on exit
+        if self._lock_file is not None:
+            self._lock_file.close()
+            self._lock_file = None
+
+    def _load(self):
+        from .models import Task
+
+        upcoming = (
+            Task.objects
+            .filter(completed=False, due_date__gt=timezone.now())
+            .values_list('id', 'due_date')
+            .iterator()
+        )
+        loaded = {task_id: due_date.timestamp() for task_id, due_date in upcoming}
+
+        with self._condition:
+            # Keep anything scheduled by signals while the load was running
+            loaded.update(self._pending)
+            self._pending = loaded
+            self._heap = [(due_ts, task_id) for task_id, due_ts in loaded.items()]
+            heapq.heapify(self._heap)
+
+    def _compact(self):
+        # Stale entries pile up when tasks are rescheduled or deleted
+        if len(self._heap) > 2 * len(self._pending) + 64:
+            self._heap = [(ts, tid) for tid, ts in self._pending.items()]
+            heapq.heapify(self._heap)
+
+    def _next_due(self):
+        """Block until a reminder is due and return its task id, or None on stop"""
+        with self._condition:
+            while self._running:
+                while self._heap and self._pending.get(self._heap[0][1]) != self._heap[0][0]:
+                    heapq.heappop(self._heap)
+
+                if not self._heap:
+                    self._condition.wait()
+                    continue
+
+                due_ts, task_id = self._heap[0]
+                delay = due_ts - timezone.now().timestamp()
+                if delay > 0:
+                    # Far-future due dates overflow the platform timeout
+                    self._condition.wait(timeout=min(delay, threading.TIMEOUT_MAX))
+                    continue
+
+                heapq.heappop(self._heap)
+                del self._pending[task_id]
+                return task_id
+        return None
+
+    def _run(self):
+        while True:
+            task_id = self._next_due()
+            if task_id is None:
+                return
+
+            try:
+                self._fire(task_id)
+            except Exception as e:
+                logger.error(f"Reminder hook error for task {task_id}: {e}")
+            finally:
+                close_old_connections()
+
+    def _fire(self, task_id):
+        from .models import Task
+
+        # Re-check against the database in case a change bypassed signals
+        task = Task.objects.filter(pk=task_id, completed=False).first()
+        if task is None or task.due_date is None:
+            return
+        if task.due_date > timezone.now():
+            self.sync(task)
+            return
+
+        task_due.send(sender=Task, task=task)
+
+
+# Single scheduler per process
+scheduler = ReminderScheduler()
@@ -16,9 +16,10 @@ class TaskSerializer(serializers.ModelSerializer):
             'completed', 
             'created_at', 
             'updated_at',
+            'completed_at',
             'is_overdue'
         ]
-        read_only_fields = ['created_at', 'updated_at']
+        read_only_fields = ['created_at', 'updated_at', 'completed_at']
 
 class TaskCreateSerializer(serializers.ModelSerializer):
     class Meta:
@@ -29,4 +30,8 @@ class TaskCreateSerializer(serializers.ModelSerializer):
             'due_date', 
             'priority', 
             'category'
-        ]
\ No newline at end of file
+        ]
+
+class TaskImportSerializer(TaskCreateSerializer):
+    class Meta(TaskCreateSerializer.Meta):
+        fields = TaskCreateSerializer.Meta.fields + ['completed', 'completed_at']
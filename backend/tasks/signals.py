@@ -0,0 +1,25 @@
+from django.db import transaction
+from django.db.models.signals import post_delete, post_save
+from django.dispatch import Signal, receiver
+
+from .models import Task
+
+# Sent with ``task`` when a pending task's due date arrives
+task_due = Signal()
+
+
+@receiver(post_save, sender=Task)
+def sync_task_reminder(sender, instance, **kwargs):
+    from .reminders import scheduler
+
+    if scheduler.running:
+        transaction.on_commit(lambda: scheduler.sync(instance))
+
+
+@receiver(post_delete, sender=Task)
+def drop_task_reminder(sender, instance, **kwargs):
+    from .reminders import scheduler
+
+    if scheduler.running:
+        task_id = instance.pk
+        transaction.on_commit(lambda: scheduler.unschedule(task_id))
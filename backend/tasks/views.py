@@ -2,9 +2,11 @@ from rest_framework.decorators import api_view
 from rest_framework.response import Response
 from rest_framework import status
 from rest_framework.generics import ListCreateAPIView, RetrieveUpdateDestroyAPIView
+from django.db import transaction
 from django.shortcuts import get_object_or_404
 from django.utils import timezone
-from .models import Task
+from .archive import with_archived
+from .models import ArchivedTask, Task
 from .serializers import TaskSerializer, TaskCreateSerializer
 
 @api_view(['GET'])
@@ -25,6 +27,7 @@ class TaskListCreateView(ListCreateAPIView):
     
     def get_queryset(self):
         queryset = Task.objects.all()
+        archived = ArchivedTask.objects.all()
         
         # Filter by completion status
         completed = self.request.query_params.get('completed')
@@ -35,13 +38,68 @@ class TaskListCreateView(ListCreateAPIView):
         category = self.request.query_params.get('category')
         if category:
             queryset = queryset.filter(category=category)
+            archived = archived.filter(category=category)
             
         # Filter by priority
         priority = self.request.query_params.get('priority')
         if priority:
             queryset = queryset.filter(priority=priority)
+            archived = archived.filter(priority=priority)
+        
+        # Archived tasks are only read when completed history is asked for
+        include_archived = self.request.query_params.get('include_archived', '')
+        if completed and completed.lower() == 'true' and include_archived.lower() == 'true':
+            return with_archived(queryset, archived)
             
         return queryset
+    
+    def create(self, request, *args, **kwargs):
+        # Plain single-task payloads keep the default behaviour
+        many = isinstance(request.data, list)
+        if not many and 'text' not in request.data:
+            return super().create(request, *args, **kwargs)
+        
+        # Natural language (or bulk) payloads: parse server-side so the
+        # client doesn't need a separate round trip to /parse/
+        items = request.data if many else [request.data]
+        payload = []
+        confidences = []
+        for item in items:
+            if not isinstance(item, dict):
+                return Response(
+                    {'error': 'Each task must be an object'},
+                    status=status.HTTP_400_BAD_REQUEST
+                )
+            
+            text = item.get('text') or ''
+            if not isinstance(text, str):
+                return Response(
+                    {'error': 'text must be a string'},
+                    status=status.HTTP_400_BAD_REQUEST
+                )
+            text = text.strip()
+            overrides = {key: value for key, value in item.items() if key != 'text'}
+            if text:
+                data, confidence = task_parser.parse_with_overrides(text, overrides)
+            else:
+                data, confidence = overrides, None
+            payload.append(data)
+            confidences.append(confidence)
+        
+        serializer = TaskCreateSerializer(data=payload if many else payload[0], many=many)
+        serializer.is_valid(raise_exception=True)
+        with transaction.atomic():
+            saved = serializer.save()
+        tasks = saved if many else [saved]
+        
+        results = []
+        for task, confidence in zip(tasks, confidences):
+            data = TaskSerializer(task).data
+            if confidence is not None:
+                data['confidence'] = confidence
+            results.append(data)
+        
+        return Response(results if many else results[0], status=status.HTTP_201_CREATED)
 
 class TaskDetailView(RetrieveUpdateDestroyAPIView):
     queryset = Task.objects.all()
@@ -1,4 +1,4 @@
-import React, { useState, useCallback } from 'react';
+import React, { useState, useCallback, useRef } from 'react';
 import { createTask, parseNaturalLanguage } from '../services/api';
 
 interface SmartTaskInputProps {
@@ -11,9 +11,12 @@ const SmartTaskInput: React.FC<SmartTaskInputProps> = ({ onTaskCreated }) => {
   const [loading, setLoading] = useState(false);
   const [creating, setCreating] = useState(false);
   const [showPreview, setShowPreview] = useState(false);
+  // Bumped on every parse, create and clear so late parse results are dropped
+  const parseRequestId = useRef(0);
 
   // Debounced parsing function
   const parseInput = useCallback(async (text: string) => {
+    const requestId = ++parseRequestId.current;
     if (text.trim().length < 3) {
       setParsedData(null);
       setShowPreview(false);
@@ -23,17 +26,29 @@ const SmartTaskInput: React.FC<SmartTaskInputProps> = ({ onTaskCreated }) => {
     try {
       setLoading(true);
       const result = await parseNaturalLanguage(text);
+      if (requestId !== parseRequestId.current) return;
       setParsedData(result);
       setShowPreview(true);
     } catch (error) {
+      if (requestId !== parseRequestId.current) return;
       console.error('Parsing failed:', error);
       setParsedData(null);
       setShowPreview(false);
     } finally {
-      setLoading(false);
+      if (requestId === parseRequestId.current) {
+        setLoading(false);
+      }
     }
   }, []);
 
+  const resetInput = () => {
+    parseRequestId.current++;
+    setInputText('');
+    setParsedData(null);
+    setShowPreview(false);
+    setLoading(false);
+  };
+
   // Handle input changes with debouncing
   React.useEffect(() => {
     const timer = setTimeout(() => {
@@ -44,22 +59,13 @@ const SmartTaskInput: React.FC<SmartTaskInputProps> = ({ onTaskCreated }) => {
   }, [inputText, parseInput]);
 
   const handleCreateTask = async () => {
-    if (!parsedData?.parsed_task) return;
+    if (!inputText.trim()) return;
 
     try {
       setCreating(true);
-      const taskData = {
-        title: parsedData.parsed_task.title,
-        description: parsedData.parsed_task.description,
-        due_date: parsedData.parsed_task.due_date,
-        priority: parsedData.parsed_task.priority,
-        category: parsedData.parsed_task.category,
-      };
-
-      await createTask(taskData);
-      setInputText('');
-      setParsedData(null);
-      setShowPreview(false);
+      // The server parses the text itself, so no client-side merge is needed
+      await createTask({ text: inputText.trim() });
+      resetInput();
       onTaskCreated();
     } catch (error) {
       console.error('Failed to create task:', error);
@@ -285,55 +291,52 @@ const SmartTaskInput: React.FC<SmartTaskInputProps> = ({ onTaskCreated }) => {
         ))}
       </div>
     )}
-    
-    <div style={{ 
-      marginTop: '0.75rem', 
-      paddingTop: '0.75rem', 
-      borderTop: '1px solid #bae6fd',
-      display: 'flex',
-      gap: '0.5rem'
-    }}>
-      <button
-        onClick={handleCreateTask}
-        disabled={creating}
-        style={{
-          backgroundColor: '#3b82f6',
-          color: 'white',
-          border: 'none',
-          padding: '0.5rem 1rem',
-          borderRadius: '0.375rem',
-          fontSize: '0.875rem',
-          fontWeight: '500',
-          cursor: creating ? 'not-allowed' : 'pointer',
-          opacity: creating ? 0.5 : 1,
-          transition: 'all 0.2s'
-        }}
-      >
-        {creating ? 'Creating...' : '✅ Create Task'}
-      </button>
-      
-      <button
-        onClick={() => {
-          setInputText('');
-          setParsedData(null);
-          setShowPreview(false);
-        }}
-        style={{
-          backgroundColor: '#f3f4f6',
-          color: '#374151',
-          border: 'none',
-          padding: '0.5rem 1rem',
-          borderRadius: '0.375rem',
-          fontSize: '0.875rem',
-          cursor: 'pointer'
-        }}
-      >
-        Clear
-      </button>
-    </div>
   </div>
 )}
       
+      {/* Actions: creating doesn't wait for the preview, the server parses the text */}
+      {inputText.trim() && (
+        <div style={{ 
+          marginTop: '0.75rem', 
+          display: 'flex',
+          gap: '0.5rem'
+        }}>
+          <button
+            onClick={handleCreateTask}
+            disabled={creating}
+            style={{
+              backgroundColor: '#3b82f6',
+              color: 'white',
+              border: 'none',
+              padding: '0.5rem 1rem',
+              borderRadius: '0.375rem',
+              fontSize: '0.875rem',
+              fontWeight: '500',
+              cursor: creating ? 'not-allowed' : 'pointer',
+              opacity: creating ? 0.5 : 1,
+              transition: 'all 0.2s'
+            }}
+          >
+            {creating ? 'Creating...' : '✅ Create Task'}
+          </button>
+          
+          <button
+            onClick={resetInput}
+            style={{
+              backgroundColor: '#f3f4f6',
+              color: '#374151',
+              border: 'none',
+              padding: '0.5rem 1rem',
+              borderRadius: '0.375rem',
+              fontSize: '0.875rem',
+              cursor: 'pointer'
+            }}
+          >
+            Clear
+          </button>
+        </div>
+      )}
+      
       {/* Examples */}
       <div style={{ marginTop: '1rem' }}>
         <div style={{ fontSize: '0.75rem', fontWeight: '500', color: '#6b7280', marginBottom: '0.5rem' }}>
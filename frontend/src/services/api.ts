@@ -70,6 +70,7 @@ export const getTasks = async (filters?: {
   completed?: boolean;
   category?: string;
   priority?: number;
+  include_archived?: boolean;
 }) => {
   const params = new URLSearchParams();
   if (filters?.completed !== undefined) {
@@ -81,14 +82,18 @@ export const getTasks = async (filters?: {
   if (filters?.priority) {
     params.append("priority", filters.priority.toString());
   }
+  if (filters?.include_archived) {
+    params.append("include_archived", "true");
+  }
 
   const response = await api.get(`/tasks/?${params.toString()}`);
   return response.data;
 };
 
-// ✅ Create a new task
+// ✅ Create a new task (pass `text` to have the server parse it)
 export const createTask = async (taskData: {
-  title: string;
+  title?: string;
+  text?: string;
   description?: string;
   due_date?: string;
   priority?: number;
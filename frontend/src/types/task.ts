@@ -8,6 +8,7 @@ export interface Task {
   completed: boolean;
   created_at: string;
   updated_at: string;
+  completed_at?: string;
   is_overdue: boolean;
 }
 
@@ -22,4 +23,5 @@ export interface TaskFilters {
   completed?: boolean;
   category?: string;
   priority?: number;
+  include_archived?: boolean;
 }
\ No newline at end of file